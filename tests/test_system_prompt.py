@@ -0,0 +1,35 @@
+import pytest
+
+from unmute.llm import system_prompt
+from unmute.llm.system_prompt import (
+    ConstantInstructions,
+    GuessAnimalInstructions,
+    SmalltalkInstructions,
+    UnmuteExplanationInstructions,
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_llm_name(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(system_prompt, "get_readable_llm_name", lambda: "test llm")
+    system_prompt._get_system_prompt_prefix.cache_clear()
+    system_prompt._make_deterministic_system_prompt.cache_clear()
+    yield
+    # Don't leak prompts containing the fake name into other tests
+    system_prompt._get_system_prompt_prefix.cache_clear()
+    system_prompt._make_deterministic_system_prompt.cache_clear()
+
+
+def test_system_prompts_share_static_prefix():
+    prompts = [
+        ConstantInstructions().make_system_prompt(),
+        ConstantInstructions(language="fr").make_system_prompt(),
+        SmalltalkInstructions().make_system_prompt(),
+        GuessAnimalInstructions(language="en/fr").make_system_prompt(),
+        UnmuteExplanationInstructions().make_system_prompt(),
+    ]
+
+    prefix = prompts[0][: prompts[0].index("# STYLE")]
+    assert '"test llm"' in prefix
+    for prompt in prompts:
+        assert prompt.startswith(prefix)
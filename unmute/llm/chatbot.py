@@ -2,7 +2,7 @@ from logging import getLogger
 from typing import Any, Literal
 
 from unmute.llm.llm_utils import preprocess_messages_for_llm
-from unmute.llm.system_prompt import ConstantInstructions, Instructions
+from unmute.llm.system_prompt import Instructions, get_default_instructions
 
 ConversationState = Literal["waiting_for_user", "user_speaking", "bot_speaking"]
 
@@ -14,7 +14,10 @@ class Chatbot:
         # It's actually a list of ChatCompletionStreamRequestMessagesTypedDict but then
         # it's really difficult to convince Python you're passing in the right type
         self.chat_history: list[dict[Any, Any]] = [
-            {"role": "system", "content": ConstantInstructions().make_system_prompt()}
+            {
+                "role": "system",
+                "content": get_default_instructions().make_system_prompt(),
+            }
         ]
         self._instructions: Instructions | None = None
 
@@ -1,6 +1,7 @@
 import datetime
 import json
 import random
+from functools import cache, lru_cache
 from typing import Annotated, Literal, Union
 
 from pydantic import BaseModel, Field
@@ -30,18 +31,17 @@ As your first message, repond to the user's message with a greeting and some kin
 conversation starter.
 """
 
-_SYSTEM_PROMPT_TEMPLATE = """
+# Everything that is the same across conversations goes first: this prefix is formatted
+# once in _get_system_prompt_prefix(), and the parts that vary (language and the
+# instructions specific to the conversation type) are appended after it in
+# _make_system_prompt(). LLM servers cache on exact prefix matches (vLLM's automatic
+# prefix caching, OpenAI's prompt caching for prompts of 1024 tokens or more), so this
+# way the shared part of the prompt doesn't have to be re-processed for every
+# conversation.
+_SYSTEM_PROMPT_PREFIX_TEMPLATE = """
 # BASICS
 {_SYSTEM_PROMPT_BASICS}
 
-# STYLE
-Be brief.
-{language_instructions}. You cannot speak other languages because they're not
-supported by the TTS.
-
-This is important because it's a specific wish of the user:
-{additional_instructions}
-
 # TRANSCRIPTION ERRORS
 There might be some mistakes in the transcript of the user's speech.
 If what they're saying doesn't make sense, keep in mind it could be a mistake in the transcription.
@@ -76,6 +76,16 @@ If they don't answer three times, say some sort of goodbye message and end your
 with "Bye!"
 """
 
+# Followed by the additional instructions.
+_SYSTEM_PROMPT_STYLE_TEMPLATE = """
+# STYLE
+Be brief.
+{language_instructions}. You cannot speak other languages because they're not
+supported by the TTS.
+
+This is important because it's a specific wish of the user:
+"""
+
 
 LanguageCode = Literal["en", "fr", "en/fr", "fr/en"]
 LANGUAGE_CODE_TO_INSTRUCTIONS: dict[LanguageCode | None, str] = {
@@ -87,24 +97,58 @@ LANGUAGE_CODE_TO_INSTRUCTIONS: dict[LanguageCode | None, str] = {
     "fr/en": "You speak French and English.",
 }
 
+# The style section only depends on the language, so build it once per language.
+_SYSTEM_PROMPT_STYLE_SECTIONS: dict[LanguageCode | None, str] = {
+    language: _SYSTEM_PROMPT_STYLE_TEMPLATE.format(language_instructions=instructions)
+    for language, instructions in LANGUAGE_CODE_TO_INSTRUCTIONS.items()
+}
+
 
 def get_readable_llm_name():
     model = autoselect_model()
     return model.replace("-", " ").replace("_", " ")
 
 
+@cache
+def _get_system_prompt_prefix() -> str:
+    # Not built at import time because getting the LLM name might require a request
+    # to the LLM server.
+    return _SYSTEM_PROMPT_PREFIX_TEMPLATE.format(
+        _SYSTEM_PROMPT_BASICS=_SYSTEM_PROMPT_BASICS,
+        llm_name=get_readable_llm_name(),
+    )
+
+
+def _make_system_prompt(
+    additional_instructions: str, language: LanguageCode | None
+) -> str:
+    return (
+        _get_system_prompt_prefix()
+        + _SYSTEM_PROMPT_STYLE_SECTIONS[language]
+        + additional_instructions
+        + "\n"
+    )
+
+
+@lru_cache(maxsize=8)
+def _make_deterministic_system_prompt(
+    additional_instructions: str, language: LanguageCode | None
+) -> str:
+    """Build and cache system prompts that don't contain any random elements."""
+    return _make_system_prompt(additional_instructions, language)
+
+
 class ConstantInstructions(BaseModel):
+    # Instructions are never modified after parsing. Freezing them also makes them
+    # hashable.
+    model_config = {"frozen": True}
+
     type: Literal["constant"] = "constant"
     text: str = _DEFAULT_ADDITIONAL_INSTRUCTIONS
     language: LanguageCode | None = None
 
     def make_system_prompt(self) -> str:
-        return _SYSTEM_PROMPT_TEMPLATE.format(
-            _SYSTEM_PROMPT_BASICS=_SYSTEM_PROMPT_BASICS,
-            additional_instructions=self.text,
-            language_instructions=LANGUAGE_CODE_TO_INSTRUCTIONS[self.language],
-            llm_name=get_readable_llm_name(),
-        )
+        return _make_deterministic_system_prompt(self.text, self.language)
 
 
 SMALLTALK_INSTRUCTIONS = """
@@ -148,6 +192,8 @@ CONVERSATION_STARTER_SUGGESTIONS = [
 
 
 class SmalltalkInstructions(BaseModel):
+    model_config = {"frozen": True}
+
     type: Literal["smalltalk"] = "smalltalk"
     language: LanguageCode | None = None
 
@@ -164,12 +210,7 @@ class SmalltalkInstructions(BaseModel):
             ),
         )
 
-        return _SYSTEM_PROMPT_TEMPLATE.format(
-            _SYSTEM_PROMPT_BASICS=_SYSTEM_PROMPT_BASICS,
-            additional_instructions=additional_instructions,
-            language_instructions=LANGUAGE_CODE_TO_INSTRUCTIONS[self.language],
-            llm_name=get_readable_llm_name(),
-        )
+        return _make_system_prompt(additional_instructions, self.language)
 
 
 GUESS_ANIMAL_INSTRUCTIONS = """
@@ -229,6 +270,8 @@ ANIMALS_HARD = [
 
 
 class GuessAnimalInstructions(BaseModel):
+    model_config = {"frozen": True}
+
     type: Literal["guess_animal"] = "guess_animal"
     language: LanguageCode | None = None
 
@@ -238,12 +281,7 @@ class GuessAnimalInstructions(BaseModel):
             animal_hard=random.choice(ANIMALS_HARD),
         )
 
-        return _SYSTEM_PROMPT_TEMPLATE.format(
-            _SYSTEM_PROMPT_BASICS=_SYSTEM_PROMPT_BASICS,
-            additional_instructions=additional_instructions,
-            language_instructions=LANGUAGE_CODE_TO_INSTRUCTIONS[self.language],
-            llm_name=get_readable_llm_name(),
-        )
+        return _make_system_prompt(additional_instructions, self.language)
 
 
 QUIZ_SHOW_INSTRUCTIONS = """
@@ -268,6 +306,8 @@ message.
 
 
 class QuizShowInstructions(BaseModel):
+    model_config = {"frozen": True}
+
     type: Literal["quiz_show"] = "quiz_show"
     language: LanguageCode | None = None
 
@@ -281,12 +321,7 @@ class QuizShowInstructions(BaseModel):
             ),
         )
 
-        return _SYSTEM_PROMPT_TEMPLATE.format(
-            _SYSTEM_PROMPT_BASICS=_SYSTEM_PROMPT_BASICS,
-            additional_instructions=additional_instructions,
-            language_instructions=LANGUAGE_CODE_TO_INSTRUCTIONS[self.language],
-            llm_name=get_readable_llm_name(),
-        )
+        return _make_system_prompt(additional_instructions, self.language)
 
 
 NEWS_INSTRUCTIONS = """
@@ -306,6 +341,8 @@ The news:
 
 
 class NewsInstructions(BaseModel):
+    model_config = {"frozen": True}
+
     type: Literal["news"] = "news"
     language: LanguageCode | None = None
 
@@ -322,17 +359,21 @@ class NewsInstructions(BaseModel):
 
         articles = news.articles[:10]
         random.shuffle(articles)  # to avoid bias of the LLM
-        articles_serialized = json.dumps([article.model_dump() for article in articles])
+        # Compact separators and no \uXXXX escapes: whitespace and escapes in the
+        # prompt are tokens that the LLM has to process on every turn.
+        articles_serialized = json.dumps(
+            [article.model_dump() for article in articles],
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
 
-        return _SYSTEM_PROMPT_TEMPLATE.format(
-            _SYSTEM_PROMPT_BASICS=_SYSTEM_PROMPT_BASICS,
-            additional_instructions=NEWS_INSTRUCTIONS.format(
+        return _make_system_prompt(
+            NEWS_INSTRUCTIONS.format(
                 news=articles_serialized,
                 current_time=datetime.datetime.now().strftime("%A, %B %d, %Y at %H:%M"),
                 timezone=datetime.datetime.now().astimezone().tzname(),
             ),
-            language_instructions=LANGUAGE_CODE_TO_INSTRUCTIONS[self.language],
-            llm_name=get_readable_llm_name(),
+            self.language,
         )
 
 
@@ -360,15 +401,12 @@ The voice cloning model is not open-sourced directly, but we have a large databa
 
 
 class UnmuteExplanationInstructions(BaseModel):
+    model_config = {"frozen": True}
+
     type: Literal["unmute_explanation"] = "unmute_explanation"
 
     def make_system_prompt(self) -> str:
-        return _SYSTEM_PROMPT_TEMPLATE.format(
-            _SYSTEM_PROMPT_BASICS=_SYSTEM_PROMPT_BASICS,
-            additional_instructions=UNMUTE_EXPLANATION_INSTRUCTIONS,
-            language_instructions=LANGUAGE_CODE_TO_INSTRUCTIONS["en"],
-            llm_name=get_readable_llm_name(),
-        )
+        return _make_deterministic_system_prompt(UNMUTE_EXPLANATION_INSTRUCTIONS, "en")
 
 
 Instructions = Annotated[
@@ -385,4 +423,5 @@ Instructions = Annotated[
 
 
 def get_default_instructions() -> Instructions:
-    return ConstantInstructions()
+    # Only defaults, so there is nothing to validate
+    return ConstantInstructions.model_construct()
@@ -37,6 +37,12 @@ from unmute.tts.realtime_queue import RealtimeQueue
 from unmute.tts.voices import VoiceSample
 from unmute.websocket_utils import ws_to_http
 
+try:
+    # Comes with uvicorn[standard], but isn't available on Windows
+    import uvloop  # type: ignore
+except ImportError:
+    uvloop = None
+
 TARGET_CHANNELS = 1  # Mono
 MAX_N_MESSAGES = 6
 
@@ -44,12 +50,27 @@ emit_logger = logging.getLogger("emit")
 receive_logger = logging.getLogger("receive")
 main_logger = logging.getLogger("main")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(process)d %(name)s %(levelname)s: %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+
+ServerEventAdapter = TypeAdapter(
+    Annotated[ora.ServerEvent, Field(discriminator="type")]
 )
 
+# Audio is sent ~every 20ms, so instead of building an InputAudioBufferAppend and
+# serializing it for each frame, splice the base64 data into a pre-serialized message.
+# Base64 never needs JSON escaping and the server doesn't need an `event_id`.
+_INPUT_AUDIO_BUFFER_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_INPUT_AUDIO_BUFFER_APPEND_SUFFIX = '"}'
+
+
+def setup_logging():
+    # Not done at import time so that importing this module (e.g. for preview_audio)
+    # doesn't change the logging config of the importer.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(process)d %(name)s %(levelname)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
 
 def base64_encode_audio(audio: np.ndarray):
     pcm_bytes = audio_to_int16(audio)
@@ -117,7 +138,7 @@ async def emit_loop(
                     emit_logger.info("Received CloseStream, closing connection.")
                     break
 
-                emit_logger.info(f"Queuing up {len(data) / SAMPLE_RATE:.1f}s of audio.")
+                emit_logger.info("Queuing up %.1fs of audio.", len(data) / SAMPLE_RATE)
 
                 for i in range(0, len(data), OUTPUT_FRAME_SIZE):
                     queue_up_chunk(data[i : i + OUTPUT_FRAME_SIZE])
@@ -129,13 +150,13 @@ async def emit_loop(
 
             async for _, opus_bytes in queue:
                 await websocket.send(
-                    ora.InputAudioBufferAppend(
-                        audio=base64.b64encode(opus_bytes).decode("utf-8"),
-                    ).model_dump_json()
+                    _INPUT_AUDIO_BUFFER_APPEND_PREFIX
+                    + base64.b64encode(opus_bytes).decode("ascii")
+                    + _INPUT_AUDIO_BUFFER_APPEND_SUFFIX
                 )
 
     except websockets.ConnectionClosed as e:
-        emit_logger.info(f"Connection closed while sending messages: {e}")
+        emit_logger.info("Connection closed while sending messages: %s", e)
 
     emit_logger.info("Finished sending messages.")
 
@@ -164,9 +185,7 @@ async def receive_loop(
             assert isinstance(message_raw, str), (
                 f"Message is not a string: {message_raw}"
             )
-            message: ora.ServerEvent = TypeAdapter(
-                Annotated[ora.ServerEvent, Field(discriminator="type")]
-            ).validate_json(message_raw)
+            message: ora.ServerEvent = ServerEventAdapter.validate_json(message_raw)
 
             if isinstance(message, ora.ResponseCreated):  # start
                 assistant_stopwatch.time_phase_if_not_started("response_created")
@@ -260,11 +279,11 @@ async def receive_loop(
             ):
                 pass  # ignored message
             else:
-                receive_logger.info(f"Received unknown message: {message}")
+                receive_logger.info("Received unknown message: %s", message)
 
         await audio_to_emit.put(CloseStream())
     except websockets.ConnectionClosed as e:
-        receive_logger.info(f"Connection closed while receiving messages: {e}")
+        receive_logger.info("Connection closed while receiving messages: %s", e)
         if e.code != websockets.CloseCode.NORMAL_CLOSURE:
             return e
 
@@ -290,7 +309,7 @@ def get_voice(server_url: str, basic_auth: tuple[str, str] | None) -> str:
 
 def check_health(server_url: str, basic_auth: tuple[str, str] | None):
     health_url = ws_to_http(server_url).strip("/") + "/v1/health"
-    main_logger.info(f"Checking health at {health_url}")
+    main_logger.info("Checking health at %s", health_url)
     response = requests.get(health_url, auth=basic_auth)
 
     if response.status_code != 200:
@@ -313,17 +332,29 @@ async def _main(
     async with websockets.connect(
         websocket_url,
         subprotocols=[websockets.Subprotocol("realtime")],
+        # Same as the server, which runs with --ws-per-message-deflate=false
+        compression=None,
     ) as websocket:
-        main_logger.info(f"Connected to {websocket_url}")
+        main_logger.info("Connected to %s", websocket_url)
         audio_to_emit: asyncio.Queue[np.ndarray | CloseStream] = asyncio.Queue()
 
-        emit_task = asyncio.create_task(emit_loop(websocket, audio_to_emit, voice))
-        receive_task = asyncio.create_task(
-            receive_loop(websocket, audio_to_emit, audio_files_data, listen=listen)
-        )
-        _, receive_report = await asyncio.gather(emit_task, receive_task)
+        # Unlike asyncio.gather(), the TaskGroup cancels the other loop if one fails
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(emit_loop(websocket, audio_to_emit, voice))
+                receive_task = tg.create_task(
+                    receive_loop(
+                        websocket, audio_to_emit, audio_files_data, listen=listen
+                    )
+                )
+        except ExceptionGroup as e:
+            # Unwrap so that callers and the error reports see the original exception,
+            # like they did with asyncio.gather()
+            if len(e.exceptions) == 1:
+                raise e.exceptions[0] from None
+            raise
 
-        return receive_report
+        return receive_task.result()
 
 
 def main_one_worker(
@@ -338,14 +369,17 @@ def main_one_worker(
         time.sleep(delay)
 
     try:
+        # uvloop keeps the client's per-frame overhead down, so that the load test
+        # measures the server and not the client.
         return asyncio.run(
-            _main(audio_files_data, server_url, basic_auth, listen=listen)
+            _main(audio_files_data, server_url, basic_auth, listen=listen),
+            loop_factory=uvloop.new_event_loop if uvloop is not None else None,
         )
     except Exception as e:
         if not catch_exceptions:
             raise
         else:
-            main_logger.error(f"Error in main_one_worker: {e}")
+            main_logger.error("Error in main_one_worker: %s", e)
             return e
 
 
@@ -382,7 +416,9 @@ def main(
         audio_file_data = audio_file_data[0]  # Take first channel to make it mono
         audio_files_data.append(audio_file_data)
 
-    with multiprocessing.Pool(n_workers) as pool:
+    # The initializer is for the "spawn" start method, where workers don't inherit
+    # the logging config.
+    with multiprocessing.Pool(n_workers, initializer=setup_logging) as pool:
         # Use starmap_async to allow for KeyboardInterrupt handling
 
         async_result = pool.starmap_async(
@@ -439,6 +475,8 @@ def main(
 
 
 if __name__ == "__main__":
+    setup_logging()
+
     parser = argparse.ArgumentParser(
         description="Load test client for the Unmute server."
     )
@@ -485,7 +485,7 @@ async def receive_loop(
             message_to_record = None
 
         else:
-            logger.info("Ignoring message:", str(message)[:100])
+            logger.info("Ignoring message: %s", str(message)[:100])
 
         if message_to_record is not None and handler.recorder is not None:
             await handler.recorder.add_event("client", message_to_record)
@@ -504,9 +504,11 @@ class EmitDebugLogger:
             self.last_emitted_type = to_emit.type
 
         if self.last_emitted_n == 1:
-            logger.debug(f"Emitting: {to_emit.type}")
+            logger.debug("Emitting: %s", to_emit.type)
         else:
-            logger.debug(f"Emitting ({self.last_emitted_n}): {self.last_emitted_type}")
+            logger.debug(
+                "Emitting (%d): %s", self.last_emitted_n, self.last_emitted_type
+            )
 
 
 async def emit_loop(
@@ -130,7 +130,10 @@ class SpeechToText(ServiceWithStartup):
     async def start_up(self):
         logger.info(f"Connecting to STT {self.stt_instance}...")
         self.websocket = await websockets.connect(
-            self.stt_instance + SPEECH_TO_TEXT_PATH, additional_headers=HEADERS
+            self.stt_instance + SPEECH_TO_TEXT_PATH,
+            additional_headers=HEADERS,
+            # Audio frames don't compress well, deflate would just add latency
+            compression=None,
         )
         logger.info("Connected to STT")
 
@@ -183,10 +186,16 @@ class SpeechToText(ServiceWithStartup):
         # The pause prediction is all over the place in the first few steps, so ignore.
         n_steps_to_wait = 12
 
+        # Equivalent to `async for message_bytes in self.websocket`, which stops on
+        # ConnectionClosedOK just like the handler below, but without going through an
+        # async generator for every message.
+        recv = self.websocket.recv
         try:
-            async for message_bytes in self.websocket:
+            while True:
+                message_bytes = await recv()
                 data = msgpack.unpackb(message_bytes)  # type: ignore
-                logger.debug(f"{my_id} {self.pause_prediction.value} got {data}")
+                # Lazy %-formatting because this runs for every STT step
+                logger.debug("%s %s got %s", my_id, self.pause_prediction.value, data)
                 message: STTMessage = STTMessageAdapter.validate_python(data)
 
                 match message:
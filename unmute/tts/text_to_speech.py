@@ -209,6 +209,8 @@ class TextToSpeech(ServiceWithStartup):
         self.websocket = await websockets.connect(
             url,
             additional_headers=HEADERS,
+            # Audio frames don't compress well, deflate would just add latency
+            compression=None,
         )
         logger.debug("Connected to TTS")
 
@@ -272,8 +274,13 @@ class TextToSpeech(ServiceWithStartup):
 
         output_queue: RealtimeQueue[TTSMessage] = RealtimeQueue()
 
+        # Equivalent to `async for message_bytes in self.websocket` (see
+        # SpeechToText.__aiter__). Bind recv first because shutdown() sets
+        # self.websocket to None.
+        recv = self.websocket.recv
         try:
-            async for message_bytes in self.websocket:
+            while True:
+                message_bytes = await recv()
                 message_dict = msgpack.unpackb(cast(Any, message_bytes))
                 message: TTSMessage = TTSMessageAdapter.validate_python(message_dict)
 